@@ -1,18 +1,23 @@
 """Simple FastAPI backend powering the map frontend."""
 from __future__ import annotations
 
+import asyncio
 import csv
-import json
+import logging
 import os
+import re
+import shelve
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
-from urllib.error import HTTPError, URLError
 from urllib.parse import quote
-from urllib.request import Request, urlopen
 
+import httpx
+import numpy as np
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -20,11 +25,20 @@ from pydantic import BaseModel, ConfigDict, Field
 BASE_DIR = Path(__file__).resolve().parent
 POINTS_CSV = BASE_DIR / "lokalzacja.csv"
 DATABASE_CSV = BASE_DIR / "database.csv"
+OSRM_CACHE_PATH = BASE_DIR / "osrm_cache.db"
+# "lat, lng" (or "lat; lng") as stored in the 'GPS ID' column.
+GPS_PATTERN = re.compile(r"^\s*([-+]?\d+(?:\.\d+)?)\s*[,;]\s*([-+]?\d+(?:\.\d+)?)\s*$")
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s [%(funcName)s] %(message)s")
+logging.getLogger("httpx").setLevel(logging.WARNING)  # skip per-request INFO lines
+logger = logging.getLogger(__name__)
 
 
 class Point(BaseModel):
     """Represents a point of interest."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     name: str
     lat: float
@@ -35,12 +49,20 @@ class Point(BaseModel):
 class Route(BaseModel):
     """Represents a bidirectional connection between two points."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra="ignore")
 
     from_id: str = Field(..., alias="from_id")
     to_id: str = Field(..., alias="to_id")
 
 
+@dataclass(slots=True, frozen=True)
+class RouteRecord:
+    """Internal storage for a route; converted to ``Route`` only in responses."""
+
+    from_id: str
+    to_id: str
+
+
 class RouteRequest(BaseModel):
     """Request body for adding or removing routes."""
 
@@ -48,12 +70,20 @@ class RouteRequest(BaseModel):
     to_id: str
 
 
-app = FastAPI(title="Points & Routes API")
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: object) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+app = FastAPI(title="Points & Routes API", default_response_class=OrjsonResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After"],  # read by the map while route geometry is pending
 )
 app.mount(
     "/llm-html",
@@ -62,53 +92,111 @@ app.mount(
 )
 
 
+CSV_CACHE_HEADERS = {"Cache-Control": "public, max-age=300"}
+
+
+def csv_file_response(file_path: Path, detail: str | Dict[str, str]) -> FileResponse:
+    """Serve a CSV file, with a single stat() doubling as the existence check."""
+    try:
+        stat_result = file_path.stat()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=detail) from None
+    return FileResponse(
+        file_path,
+        media_type="text/csv",
+        stat_result=stat_result,
+        headers=CSV_CACHE_HEADERS,
+    )
+
+
 @app.get("/lokalzacja.csv")
 def get_lokalizacja_csv() -> FileResponse:
     """Serve lokalizacja CSV for the frontend fallback."""
-    if not POINTS_CSV.exists():
-        raise HTTPException(status_code=404, detail="lokalzacja.csv not found")
-    return FileResponse(POINTS_CSV, media_type="text/csv")
+    return csv_file_response(POINTS_CSV, "lokalzacja.csv not found")
 
 
 @app.get("/database.csv")
 def get_database_csv() -> FileResponse:
     """Serve database CSV for the frontend fallback."""
-    if not DATABASE_CSV.exists():
-        raise HTTPException(status_code=404, detail="database.csv not found")
-    return FileResponse(DATABASE_CSV, media_type="text/csv")
+    return csv_file_response(DATABASE_CSV, "database.csv not found")
 
 points: Dict[str, Point] = {}
-routes: List[Route] = []
-route_index: Set[Tuple[str, str]] = set()
+routes: Dict[Tuple[str, str], RouteRecord] = {}
 lokalizacja_sequence: List[str] = []
 optimized_sequence: List[str] = []
 full_route_geojson: Dict | None = None
+# Serialized full_route_geojson, rebuilt on reload and served as-is.
+_route_geojson_bytes: bytes | None = None
+# Serialized /points and /routes bodies; routes are re-encoded lazily after edits.
+_points_bytes: bytes = b"[]"
+_routes_bytes: bytes | None = None
+# Ids and coordinates full_route_geojson was computed for.
+_last_geometry_key: Tuple[Tuple[str, float, float], ...] | None = None
 
 OSRM_PROFILE = "walking"
 OSRM_ROUTE_URL = f"https://router.project-osrm.org/route/v1/{OSRM_PROFILE}"
+# Waypoints per fallback request; keeps the URL well under OSRM's limits.
+OSRM_CHUNK_SIZE = 50
+
+# Shared client so segment requests can run concurrently over pooled connections.
+# Idle keep-alive connections are reused across reloads, skipping new TLS
+# handshakes; the transport retries failed connection attempts.
+osrm_client = httpx.AsyncClient(
+    timeout=20,
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(
+            max_connections=64, max_keepalive_connections=16, keepalive_expiry=60
+        ),
+    ),
+)
+
+# OSRM results keyed by point ids; each entry stores the coordinates it was
+# computed for, so moving a point in the CSV invalidates its cached geometry.
+# The shelf on disk is read once and new entries are written back in batches.
+_osrm_cache: Dict[str, Tuple[str, object]] = {}
+_osrm_cache_pending: Dict[str, Tuple[str, object]] = {}
+_osrm_cache_loaded = False
 
 
 def normalize_route_ids(from_id: str, to_id: str) -> Tuple[str, str]:
     """Return a sorted tuple to represent a bidirectional route."""
-    return tuple(sorted((from_id, to_id)))
+    return (from_id, to_id) if from_id <= to_id else (to_id, from_id)
 
 
-def _add_route_internal(from_id: str, to_id: str) -> Route | None:
+def _add_route_internal(from_id: str, to_id: str) -> RouteRecord | None:
     """Internal helper to register routes without raising HTTP errors."""
+    global _routes_bytes
     if from_id == to_id:
         return None
     if from_id not in points or to_id not in points:
         return None
     normalized = normalize_route_ids(from_id, to_id)
-    if normalized in route_index:
+    if normalized in routes:
         return None
-    route = Route(from_id=normalized[0], to_id=normalized[1])
-    routes.append(route)
-    route_index.add(normalized)
-    print(f"[_add_route_internal] added route {route.from_id} -> {route.to_id}")
+    route = RouteRecord(from_id=normalized[0], to_id=normalized[1])
+    routes[normalized] = route
+    _routes_bytes = None
+    logger.debug("added route %s -> %s", route.from_id, route.to_id)
     return route
 
 
+def _column_index(headers: List[str], *names: str) -> int | None:
+    """Return the position of the first header matching one of ``names``."""
+    for name in names:
+        if name in headers:
+            return headers.index(name)
+    return None
+
+
+def _cell(row: List[str], index: int | None) -> str:
+    """Return a stripped cell value, or an empty string for missing columns."""
+    if index is None or index >= len(row):
+        return ""
+    return row[index].strip()
+
+
 def load_lokalizacja_points(file_path: Path) -> Tuple[Dict[str, Point], List[str]]:
     """Load sequential points from lokalzacja.csv."""
     if not file_path.exists():
@@ -118,26 +206,27 @@ def load_lokalizacja_points(file_path: Path) -> Tuple[Dict[str, Point], List[str
     sequential_ids: List[str] = []
 
     with file_path.open(newline="", encoding="utf-8-sig") as csvfile:
-        reader = csv.DictReader(csvfile, delimiter=";")
-        for idx, raw_row in enumerate(reader, start=1):
-            normalized_row = {
-                (key or "").strip().lstrip("\ufeff"): (value or "").strip()
-                for key, value in raw_row.items()
-            }
-            point_id = normalized_row.get("ID")
+        reader = csv.reader(csvfile, delimiter=";")
+        headers = [header.strip() for header in next(reader, [])]
+        idx_id = _column_index(headers, "ID")
+        idx_x = _column_index(headers, "x", "X")  # x = longitude
+        idx_y = _column_index(headers, "y", "Y")  # y = latitude
+        idx_name = _column_index(headers, "Localization", "Localisation")
+
+        for idx, row in enumerate(reader, start=1):
+            point_id = _cell(row, idx_id)
             if not point_id:
                 continue
             try:
-                lng = float(normalized_row.get("x") or normalized_row.get("X"))  # x = longitude
-                lat = float(normalized_row.get("y") or normalized_row.get("Y"))  # y = latitude
-            except (TypeError, ValueError) as exc:
-                raise ValueError(f"Invalid coordinates in row: {normalized_row}") from exc
+                lng = float(_cell(row, idx_x))
+                lat = float(_cell(row, idx_y))
+            except ValueError as exc:
+                raise ValueError(f"Invalid coordinates in row: {row}") from exc
 
-            point = Point(
+            # Values are already stripped strings and parsed floats.
+            point = Point.model_construct(
                 id=point_id,
-                name=normalized_row.get("Localization")
-                or normalized_row.get("Localisation")
-                or f"Localization {idx}",
+                name=_cell(row, idx_name) or f"Localization {idx}",
                 lat=lat,
                 lng=lng,
             )
@@ -147,45 +236,75 @@ def load_lokalizacja_points(file_path: Path) -> Tuple[Dict[str, Point], List[str
     return loaded_points, sequential_ids
 
 
+def _db_index(point_id: str) -> int | None:
+    """Return ``n`` for ids of the form ``db_<n>``."""
+    suffix = point_id[3:]
+    if point_id.startswith("db_") and suffix.isdecimal():
+        return int(suffix)
+    return None
+
+
+def _frame_column(frame, headers: List[str], *names: str):
+    """Return the stripped DataFrame column matching one of ``names``, if any."""
+    index = _column_index(headers, *names)
+    if index is None:
+        return None
+    return frame.iloc[:, index].str.strip()
+
+
 def load_database_points(file_path: Path, existing: Dict[str, Point]) -> Dict[str, Point]:
     """Load additional points from database.csv (with 'GPS ID')."""
     if not file_path.exists():
         return existing
 
-    next_index = 1
-    with file_path.open(newline="", encoding="utf-8-sig") as csvfile:
-        reader = csv.DictReader(csvfile, delimiter=";")
-        for raw_row in reader:
-            normalized_row = {
-                (key or "").strip().lstrip("\ufeff"): (value or "").strip()
-                for key, value in raw_row.items()
-            }
-            gps_value = normalized_row.get("GPS ID") or normalized_row.get("gps id")
-            if not gps_value:
-                continue
-            cleaned = gps_value.strip()
-            parts = [part.strip() for part in cleaned.replace(";", ",").split(",") if part.strip()]
-            if len(parts) != 2:
-                continue
-            try:
-                lat, lng = float(parts[0]), float(parts[1])
-            except ValueError:
-                continue
-
-            point_id = normalized_row.get("id") or f"db_{next_index}"
-            while point_id in existing:
-                next_index += 1
-                point_id = f"db_{next_index}"
+    import pandas as pd  # imported lazily: only needed when (re)loading data
+
+    frame = pd.read_csv(
+        file_path,
+        sep=";",
+        dtype=str,
+        encoding="utf-8-sig",
+        keep_default_na=False,
+        on_bad_lines="warn",
+    ).fillna("")
+    headers = [str(header).strip() for header in frame.columns]
+    gps_values = _frame_column(frame, headers, "GPS ID", "gps id")
+    if gps_values is None:
+        return existing
 
-            point = Point(
-                id=point_id,
-                name=normalized_row.get("Name") or normalized_row.get("name") or point_id,
-                lat=lat,
-                lng=lng,
-                description=normalized_row.get("Description"),
-            )
-            existing[point.id] = point
-            next_index += 1
+    parts = gps_values.str.extract(GPS_PATTERN)
+    lat_text = parts[0]
+    lng_text = parts[1]
+    valid = lat_text.notna() & lng_text.notna()
+
+    rows = pd.DataFrame(
+        {
+            "id": _frame_column(frame, headers, "id"),
+            "name": _frame_column(frame, headers, "Name", "name"),
+            "description": _frame_column(frame, headers, "Description"),
+            # astype(float) keeps full precision (pandas' fast parser may not).
+            "lat": lat_text[valid].astype(float),
+            "lng": lng_text[valid].astype(float),
+        },
+        index=frame.index,
+    )[valid]
+
+    # Fallback ids continue after the highest db_<n> already taken.
+    next_index = max(filter(None, map(_db_index, existing)), default=0) + 1
+    for row in rows.itertuples(index=False):
+        point_id = row.id
+        if not point_id or point_id in existing:
+            point_id = f"db_{next_index}"
+        next_index = max(next_index, (_db_index(point_id) or 0) + 1)
+
+        point = Point.model_construct(
+            id=point_id,
+            name=row.name or point_id,
+            lat=float(row.lat),
+            lng=float(row.lng),
+            description=row.description,
+        )
+        existing[point.id] = point
 
     return existing
 
@@ -197,35 +316,124 @@ def build_path_connections(sequence: List[str]) -> List[Tuple[str, str]]:
     return [(sequence[i], sequence[i + 1]) for i in range(len(sequence) - 1)]
 
 
+def load_osrm_cache_file() -> Dict[str, Tuple[str, object]]:
+    """Read all entries from the on-disk shelf (blocking).
+
+    The files are disposable, so a corrupt shelf or entry counts as a miss.
+    """
+    entries: Dict[str, Tuple[str, object]] = {}
+    try:
+        with shelve.open(str(OSRM_CACHE_PATH)) as shelf:
+            for key in list(shelf.keys()):
+                try:
+                    entry = shelf[key]
+                except Exception as error:  # noqa: BLE001
+                    logger.warning("Skipping unreadable OSRM cache entry %s: %s", key, error)
+                    continue
+                if isinstance(entry, tuple) and len(entry) == 2:
+                    entries[key] = entry
+    except Exception as error:  # noqa: BLE001
+        logger.warning("Failed to read OSRM cache: %s", error)
+    return entries
+
+
+def save_osrm_cache_file(entries: Dict[str, Tuple[str, object]]) -> bool:
+    """Write entries to the on-disk shelf (blocking); return whether it worked."""
+    try:
+        with shelve.open(str(OSRM_CACHE_PATH)) as shelf:
+            shelf.update(entries)
+    except Exception as error:  # noqa: BLE001
+        logger.warning("Failed to persist OSRM cache: %s", error)
+        return False
+    return True
+
+
+async def load_osrm_cache() -> None:
+    """Fill the in-memory OSRM cache from disk once, off the event loop.
+
+    Callers hold _reload_lock, so no fetch or flush runs during the read.
+    """
+    global _osrm_cache_loaded
+    if _osrm_cache_loaded:
+        return
+    for key, entry in (await asyncio.to_thread(load_osrm_cache_file)).items():
+        _osrm_cache.setdefault(key, entry)
+    _osrm_cache_loaded = True
+
+
+async def flush_osrm_cache() -> None:
+    """Persist entries fetched since the last flush, off the event loop.
+
+    Callers hold _reload_lock; a failed write is queued again for next time.
+    """
+    if not _osrm_cache_pending:
+        return
+    entries = dict(_osrm_cache_pending)
+    _osrm_cache_pending.clear()
+    if not await asyncio.to_thread(save_osrm_cache_file, entries):
+        for key, entry in entries.items():
+            _osrm_cache_pending.setdefault(key, entry)
+
+
+def as_coordinate_array(coordinates: object) -> np.ndarray:
+    """Store LineString coordinates compactly as an (N, 2) float32 array."""
+    return np.asarray(coordinates, dtype=np.float32)
+
+
+def read_osrm_cache(key: str, version: str) -> object | None:
+    """Return a cached OSRM result if it was computed for ``version``."""
+    entry = _osrm_cache.get(key)
+    if entry is None:
+        return None
+    cached_version, value = entry
+    return value if cached_version == version else None
+
 
-def fetch_osrm_segment(start_point: Point, end_point: Point) -> Tuple[List[List[float]], float | None, float | None] | None:
+def write_osrm_cache(key: str, version: str, value: object) -> None:
+    """Store an OSRM result in memory and queue it for the next flush."""
+    entry = (version, value)
+    _osrm_cache[key] = entry
+    _osrm_cache_pending[key] = entry
+
+
+async def fetch_osrm_segment(start_point: Point, end_point: Point) -> Tuple[np.ndarray, float | None, float | None] | None:
     """Fetch a single OSRM segment between two coordinates."""
-    url = (
-        f"{OSRM_ROUTE_URL}/{start_point.lng},{start_point.lat};"
-        f"{end_point.lng},{end_point.lat}?overview=full&geometries=geojson"
-    )
+    cache_key = f"segment:{start_point.id}->{end_point.id}"
+    coordinates = f"{start_point.lng},{start_point.lat};{end_point.lng},{end_point.lat}"
+    cached = read_osrm_cache(cache_key, coordinates)
+    if cached is not None:
+        return cached
+
+    url = f"{OSRM_ROUTE_URL}/{coordinates}?overview=full&geometries=geojson"
     try:
-        with urlopen(url, timeout=20) as response:
-            payload = json.loads(response.read().decode("utf-8"))
-    except (HTTPError, URLError, TimeoutError) as error:
-        print(f"[fetch_osrm_segment] Failed to call OSRM: {error}")
+        response = await osrm_client.get(url)
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
+    except (httpx.HTTPError, orjson.JSONDecodeError) as error:
+        logger.warning("Failed to call OSRM: %s", error)
         return None
 
     routes_payload = payload.get("routes") or []
     if not routes_payload:
-        print("[fetch_osrm_segment] OSRM returned no routes.")
+        logger.warning("OSRM returned no routes.")
         return None
 
     route_payload = routes_payload[0]
     geometry = route_payload.get("geometry")
     if not geometry or geometry.get("type") != "LineString":
-        print("[fetch_osrm_segment] OSRM response missing geometry.")
+        logger.warning("OSRM response missing geometry.")
         return None
 
-    return geometry.get("coordinates", []), route_payload.get("distance"), route_payload.get("duration")
+    segment = (
+        as_coordinate_array(geometry.get("coordinates", [])),
+        route_payload.get("distance"),
+        route_payload.get("duration"),
+    )
+    write_osrm_cache(cache_key, coordinates, segment)
+    return segment
 
 
-def fetch_osrm_route(sequence: List[str]) -> Tuple[Dict, List[str]] | None:
+async def fetch_osrm_route(sequence: List[str]) -> Tuple[Dict, List[str]] | None:
     """Call OSRM route API to connect all points in the given order."""
     coordinates: List[str] = []
     ordered_ids: List[str] = []
@@ -241,29 +449,38 @@ def fetch_osrm_route(sequence: List[str]) -> Tuple[Dict, List[str]] | None:
         return None
 
     joined = ";".join(coordinates)
+    cache_key = "route:" + ";".join(ordered_ids)
+    cached = read_osrm_cache(cache_key, joined)
+    if cached is not None:
+        return cached
+
     encoded = quote(joined, safe=";,")
     url = f"{OSRM_ROUTE_URL}/{encoded}?overview=full&geometries=geojson"
 
     try:
-        with urlopen(url, timeout=20) as response:
-            payload = json.loads(response.read().decode("utf-8"))
-    except (HTTPError, URLError, TimeoutError) as error:
-        print(f"[fetch_osrm_route] Failed to call OSRM route: {error}")
+        response = await osrm_client.get(url)
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
+    except (httpx.HTTPError, orjson.JSONDecodeError) as error:
+        logger.warning("Failed to call OSRM route: %s", error)
         return None
 
     routes_payload = payload.get("routes") or []
     if not routes_payload:
-        print("[fetch_osrm_route] OSRM returned no routes.")
+        logger.warning("OSRM returned no routes.")
         return None
 
     geometry = routes_payload[0].get("geometry")
     if not geometry:
-        print("[fetch_osrm_route] Missing geometry in route result.")
+        logger.warning("Missing geometry in route result.")
         return None
 
     feature = {
         "type": "Feature",
-        "geometry": geometry,
+        "geometry": {
+            **geometry,
+            "coordinates": as_coordinate_array(geometry.get("coordinates", [])),
+        },
         "properties": {
             "via_points": ordered_ids,
             "source": "router.project-osrm.org-route",
@@ -272,45 +489,92 @@ def fetch_osrm_route(sequence: List[str]) -> Tuple[Dict, List[str]] | None:
         },
     }
     feature_collection = {"type": "FeatureCollection", "features": [feature]}
+    write_osrm_cache(cache_key, joined, (feature_collection, ordered_ids))
     return feature_collection, ordered_ids
 
 
-def build_segment_geojson(sequence: List[str]) -> Dict | None:
-    """Fallback: connect all points using individual OSRM route calls."""
-    combined_coordinates: List[List[float]] = []
+def chunk_sequence(sequence: List[str], size: int) -> List[List[str]]:
+    """Split a path into consecutive chunks that share their boundary points."""
+    if len(sequence) < 2:
+        return []
+    return [sequence[i : i + size] for i in range(0, len(sequence) - 1, size - 1)]
+
+
+async def fetch_osrm_chunk(
+    chunk: List[str], try_route: bool = True
+) -> Tuple[List[Tuple[np.ndarray, float | None, float | None]], bool]:
+    """Fetch a chunk as one multi-waypoint route, falling back to single pairs.
+
+    Returns the segments and whether every pair of the chunk is covered.
+    """
+    route_result = await fetch_osrm_route(chunk) if try_route else None
+    if route_result:
+        feature = route_result[0]["features"][0]
+        properties = feature["properties"]
+        segment = (
+            feature["geometry"].get("coordinates", []),
+            properties.get("distance_m"),
+            properties.get("duration_s"),
+        )
+        return [segment], True
+
+    requests = [
+        fetch_osrm_segment(points[from_id], points[to_id])
+        for from_id, to_id in build_path_connections(chunk)
+    ]
+    results = await asyncio.gather(*requests, return_exceptions=True)
+    segments = [
+        segment for segment in results if segment and not isinstance(segment, BaseException)
+    ]
+    complete = len(segments) == len(requests) and all(len(segment[0]) for segment in segments)
+    return segments, complete
+
+
+async def build_segment_geojson(sequence: List[str]) -> Tuple[Dict | None, bool]:
+    """Fallback: connect all points using chunked OSRM route calls.
+
+    Returns the route and whether every segment of the path was fetched.
+    """
+    coordinate_parts: List[np.ndarray] = []
     total_distance = 0.0
     total_duration = 0.0
 
-    for from_id, to_id in build_path_connections(sequence):
-        start_point = points.get(from_id)
-        end_point = points.get(to_id)
-        if not start_point or not end_point:
-            continue
+    known_ids = [point_id for point_id in sequence if point_id in points]
+    chunks = chunk_sequence(known_ids, OSRM_CHUNK_SIZE)
+    # A single chunk is the full route refresh_route_geometry already failed on.
+    try_route = len(chunks) > 1
 
-        segment = fetch_osrm_segment(start_point, end_point)
-        if not segment:
-            continue
+    # Chunks are fetched concurrently; gather keeps results in path order.
+    results = await asyncio.gather(
+        *(fetch_osrm_chunk(chunk, try_route) for chunk in chunks)
+    )
+    segments = []
+    complete = True
+    for chunk_segments, chunk_complete in results:
+        segments.extend(chunk_segments)
+        complete = complete and chunk_complete
 
+    for segment in segments:
         coordinates, distance, duration = segment
-        if not coordinates:
+        if not len(coordinates):
             continue
 
-        if not combined_coordinates:
-            combined_coordinates.extend(coordinates)
-        else:
-            if combined_coordinates[-1] == coordinates[0]:
-                combined_coordinates.extend(coordinates[1:])
-            else:
-                combined_coordinates.extend(coordinates)
+        if coordinate_parts and np.array_equal(coordinate_parts[-1][-1], coordinates[0]):
+            coordinates = coordinates[1:]
+        if len(coordinates):
+            coordinate_parts.append(coordinates)
 
         if distance:
             total_distance += distance
         if duration:
             total_duration += duration
 
+    combined_coordinates = (
+        np.concatenate(coordinate_parts) if coordinate_parts else as_coordinate_array([])
+    )
     if len(combined_coordinates) < 2:
-        print("[build_segment_geojson] Failed to compose OSRM geometry.")
-        return None
+        logger.warning("Failed to compose OSRM geometry.")
+        return None, False
 
     feature = {
         "type": "Feature",
@@ -325,76 +589,174 @@ def build_segment_geojson(sequence: List[str]) -> Dict | None:
             "source": "router.project-osrm.org-route",
         },
     }
-    return {"type": "FeatureCollection", "features": [feature]}
+    return {"type": "FeatureCollection", "features": [feature]}, complete
 
 
-def refresh_route_geometry(sequence: List[str]) -> Dict | None:
+async def refresh_route_geometry(sequence: List[str]) -> Dict | None:
     """Fetch a walking route for lokalizacja points in the given order."""
-    global optimized_sequence
+    global optimized_sequence, _last_geometry_key
     if len(sequence) < 2:
         optimized_sequence = sequence
-        print("[refresh_route_geometry] Not enough points for OSRM route.")
+        logger.info("Not enough points for OSRM route.")
         return None
 
-    route_result = fetch_osrm_route(sequence)
+    geometry_key = tuple(
+        (point_id, points[point_id].lng, points[point_id].lat)
+        for point_id in sequence
+        if point_id in points
+    )
+    if geometry_key == _last_geometry_key and full_route_geojson is not None:
+        logger.info("points unchanged, reusing route geometry.")
+        return full_route_geojson
+
+    route_result = await fetch_osrm_route(sequence)
     if route_result:
         full_geojson, ordered_ids = route_result
         optimized_sequence = ordered_ids
-        print("[refresh_route_geometry] route order:", " -> ".join(optimized_sequence))
+        _last_geometry_key = geometry_key
+        logger.info("route order: %s", " -> ".join(optimized_sequence))
         return full_geojson
 
     optimized_sequence = sequence
-    fallback = build_segment_geojson(sequence)
-    if fallback:
-        print("[refresh_route_geometry] using segment-based fallback geometry.")
+    fallback, complete = await build_segment_geojson(sequence)
+    # Only a gap-free route is reused; otherwise the next reload retries OSRM.
+    _last_geometry_key = geometry_key if complete else None
+    if not fallback:
+        return None
+    if not complete:
+        logger.warning("fallback geometry is missing segments.")
+    logger.info("using segment-based fallback geometry.")
     return fallback
 
 
-def reload_points() -> List[Point]:
+def load_csv_points() -> Tuple[Dict[str, Point], List[str]]:
+    """Read both CSV sources; blocking, so callers run it in a worker thread."""
+    loaded_points, sequential_ids = load_lokalizacja_points(POINTS_CSV)
+    return load_database_points(DATABASE_CSV, loaded_points), sequential_ids
+
+
+async def load_point_data() -> None:
+    """Reload points from the CSV files (worker thread, no network)."""
+    global points, lokalizacja_sequence, _points_bytes
+    points, lokalizacja_sequence = await asyncio.to_thread(load_csv_points)
+    _points_bytes = orjson.dumps([point.model_dump() for point in points.values()])
+
+
+def reset_default_routes(order: List[str]) -> None:
+    """Replace all routes with the path connecting ``order``."""
+    global routes, _routes_bytes
+    # Path ids come straight from the loaded CSVs, so skip _add_route_internal's checks.
+    default_connections = (
+        normalize_route_ids(from_id, to_id)
+        for from_id, to_id in build_path_connections(order)
+        if from_id != to_id
+    )
+    routes = {normalized: RouteRecord(*normalized) for normalized in default_connections}
+    _routes_bytes = None
+    logger.info("total routes=%d", len(routes))
+
+
+async def update_route_geojson() -> None:
+    """Recompute the OSRM route for the loaded points and cache its JSON.
+
+    Must be called with _reload_lock held.
+    """
+    global full_route_geojson, _route_geojson_bytes
+    await load_osrm_cache()
+    try:
+        full_route_geojson = await refresh_route_geometry(lokalizacja_sequence)
+    finally:
+        await flush_osrm_cache()
+    _route_geojson_bytes = (
+        orjson.dumps(full_route_geojson, option=orjson.OPT_SERIALIZE_NUMPY)
+        if full_route_geojson
+        else None
+    )
+
+
+# Serializes reloads and the startup geometry task, so points, routes and
+# route geometry always come from the same CSV load.
+_reload_lock = asyncio.Lock()
+
+
+async def reload_points() -> List[Point]:
     """Reload global points and clear existing routes."""
-    global points, routes, route_index, lokalizacja_sequence, full_route_geojson
-    points, sequential_ids = load_lokalizacja_points(POINTS_CSV)
-    lokalizacja_sequence = sequential_ids
-    points = load_database_points(DATABASE_CSV, points)
-    full_route_geojson = refresh_route_geometry(lokalizacja_sequence)
-    active_order = optimized_sequence if optimized_sequence else lokalizacja_sequence
-    default_connections = build_path_connections(active_order)
-    routes = []
-    route_index = set()
-    for from_id, to_id in default_connections:
-        _add_route_internal(from_id, to_id)
-    print(f"[reload_points] total routes={len(routes)}")
-    return list(points.values())
-
-
-# Initial load
-try:
-    reload_points()
-except Exception as error:  # noqa: BLE001
-    print(f"Failed to load points on startup: {error}")
+    async with _reload_lock:
+        await load_point_data()
+        await update_route_geojson()
+        reset_default_routes(optimized_sequence if optimized_sequence else lokalizacja_sequence)
+        return list(points.values())
+
+
+# Strong references to fire-and-forget tasks, so they are not garbage collected.
+_background_tasks: Set[asyncio.Task] = set()
+# Startup geometry task; /route-geojson answers 503 (not 404) while it runs.
+_startup_geometry_task: asyncio.Task | None = None
+
+
+async def update_route_geojson_in_background() -> None:
+    """Startup task: fetch route geometry without delaying server boot."""
+    try:
+        async with _reload_lock:
+            await update_route_geojson()
+    except Exception as error:  # noqa: BLE001
+        logger.error("Failed to build route geometry on startup: %s", error)
+
+
+@app.on_event("startup")
+async def load_points_on_startup() -> None:
+    """Load points right away; OSRM geometry follows in the background."""
+    global _startup_geometry_task
+    async with _reload_lock:
+        try:
+            await load_point_data()
+        except Exception as error:  # noqa: BLE001
+            logger.error("Failed to load points on startup: %s", error)
+            return
+        reset_default_routes(lokalizacja_sequence)
+
+    task = asyncio.create_task(update_route_geojson_in_background())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    _startup_geometry_task = task
+
+
+@app.on_event("shutdown")
+async def close_osrm_client() -> None:
+    """Release pooled OSRM connections."""
+    await osrm_client.aclose()
 
 
 @app.get("/points", response_model=List[Point])
-def get_points() -> List[Point]:
+def get_points() -> Response:
     """Return all available points."""
-    return list(points.values())
+    return Response(_points_bytes, media_type="application/json")
 
 
 @app.get("/routes", response_model=List[Route])
-def get_routes() -> List[Route]:
+def get_routes() -> Response:
     """Return all existing routes."""
-    return routes
+    global _routes_bytes
+    if _routes_bytes is None:
+        _routes_bytes = orjson.dumps([asdict(route) for route in routes.values()])
+    return Response(_routes_bytes, media_type="application/json")
 
 
 @app.get("/route-geojson")
-def get_route_geojson() -> Dict:
+def get_route_geojson() -> Response:
     """Return the OSRM-backed GeoJSON route following lokalizacja points."""
-    if not full_route_geojson:
+    if _route_geojson_bytes is None:
+        if _startup_geometry_task is not None and not _startup_geometry_task.done():
+            raise HTTPException(
+                status_code=503,
+                detail={"error": "Route geometry is still being computed."},
+                headers={"Retry-After": "2"},
+            )
         raise HTTPException(
             status_code=404,
             detail={"error": "Route geometry not available – try reloading later."},
         )
-    return full_route_geojson
+    return Response(_route_geojson_bytes, media_type="application/json")
 
 
 @app.post("/routes", response_model=Route, status_code=201)
@@ -406,32 +768,28 @@ def add_route(route_request: RouteRequest) -> Route:
             status_code=400,
             detail={"error": "Invalid route (duplicate or unknown points)"},
         )
-    return route
+    return Route.model_validate(asdict(route))
 
 
 @app.delete("/routes")
 def delete_route(route_request: RouteRequest) -> Dict[str, str]:
     """Remove an existing route."""
+    global _routes_bytes
     normalized = normalize_route_ids(route_request.from_id, route_request.to_id)
-    if normalized not in route_index:
+    if routes.pop(normalized, None) is None:
         raise HTTPException(
             status_code=404, detail={"error": "Route not found between points"}
         )
-
-    route_index.remove(normalized)
-    for idx, route in enumerate(routes):
-        if normalize_route_ids(route.from_id, route.to_id) == normalized:
-            routes.pop(idx)
-            break
+    _routes_bytes = None
 
     return {"message": "Route removed successfully"}
 
 
 @app.post("/reload-points", response_model=List[Point])
-def reload_points_endpoint() -> List[Point]:
+async def reload_points_endpoint() -> List[Point]:
     """Reload points from CSV and clear routes."""
     try:
-        return reload_points()
+        return await reload_points()
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail={"error": str(exc)}) from exc
 
@@ -439,7 +797,7 @@ def reload_points_endpoint() -> List[Point]:
 @app.get("/api/route-config")
 def get_route_config() -> Dict[str, Dict[str, str]]:
     """Provide a simple route configuration for the frontend."""
-    route: Route | None = routes[0] if routes else None
+    route: RouteRecord | None = next(iter(routes.values()), None)
 
     if route is None:
         if len(points) < 2:
@@ -476,9 +834,7 @@ def serve_index() -> FileResponse:
 @app.get("/lokalizacja.csv", include_in_schema=False)
 def serve_points_csv() -> FileResponse:
     """Expose the source CSV."""
-    if not POINTS_CSV.exists():
-        raise HTTPException(status_code=404, detail={"error": "CSV file not found"})
-    return FileResponse(POINTS_CSV)
+    return csv_file_response(POINTS_CSV, {"error": "CSV file not found"})
 
 
 if __name__ == "__main__":